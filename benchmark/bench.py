@@ -0,0 +1,137 @@
+import argparse
+import csv
+import functools
+import itertools
+import os
+import platform
+import sys
+import time
+
+from cpu_work import pinned_pool, simulated_work
+
+# futuretools.py and pool.py live in the repo root, one level up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from futuretools import bounded_map, chunked_map, unordered_map
+from pool import get_pool
+
+# What each task does, given its duration
+KERNELS = {
+    "sleep": time.sleep,  # I/O-bound: seconds
+    "cpu": simulated_work,  # CPU-bound: work units (~50ms each)
+}
+DEFAULT_DURATION = {"sleep": 0.01, "cpu": 1}
+
+# The different ways the demos hand tasks to the executor
+MAPS = {
+    "executor": lambda executor, fn, tasks: executor.map(fn, tasks),
+    "bounded": bounded_map,
+    "unordered": unordered_map,
+    "chunked": functools.partial(chunked_map, chunksize=4),
+}
+
+CSV_FIELDS = [
+    "python",
+    "kernel",
+    "map",
+    "workers",
+    "pinned",
+    "tasks",
+    "duration",
+    "repeat",
+    "elapsed_ns",
+]
+
+
+def run(executor, map_fn, fn, tasks):
+    """Time one full pass of map_fn over tasks, in nanoseconds"""
+    start = time.perf_counter_ns()
+    for _ in map_fn(executor, fn, tasks):
+        pass
+    return time.perf_counter_ns() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time the demo patterns and write the results as CSV"
+    )
+    parser.add_argument("--kernel", choices=sorted(KERNELS), default="sleep")
+    parser.add_argument(
+        "--map", nargs="+", choices=sorted(MAPS), default=["executor"]
+    )
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument("--tasks", nargs="+", type=int, default=[8])
+    parser.add_argument(
+        "--duration",
+        type=float,
+        help="per task: seconds for sleep (default: 0.01), "
+        "whole work units for cpu (default: 1)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--pin",
+        action="store_true",
+        help="pin each worker thread to its own CPU (Linux only)",
+    )
+    parser.add_argument(
+        "--output", help="CSV file to write (default: standard output)"
+    )
+    args = parser.parse_args()
+
+    # Bad values fail here, not as a hang (0 workers never run anything) or
+    # a traceback out of a worker thread
+    if min(args.workers) < 1:
+        parser.error(f"--workers must be >= 1, got {min(args.workers)}")
+    if min(args.tasks) < 0:
+        parser.error(f"--tasks must be >= 0, got {min(args.tasks)}")
+    if args.repeat < 0:
+        parser.error(f"--repeat must be >= 0, got {args.repeat}")
+
+    fn = KERNELS[args.kernel]
+    duration = args.duration
+    if duration is None:
+        duration = DEFAULT_DURATION[args.kernel]
+    if duration < 0:
+        parser.error(f"--duration must be >= 0, got {duration:g}")
+    if args.kernel == "cpu":
+        if duration < 1 or duration != int(duration):
+            parser.error(
+                f"--duration for --kernel cpu must be a whole number >= 1, "
+                f"got {duration:g}"
+            )
+        duration = int(duration)
+
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    writer = csv.DictWriter(output, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+
+    for map_name, workers, num_tasks in itertools.product(
+        args.map, args.workers, args.tasks
+    ):
+        # Built before the clock starts - only the map itself is timed
+        tasks = (duration,) * num_tasks
+        # Pinned threads can't come from the shared pool - pinning them
+        # would leak into every other user of it
+        pool = pinned_pool(workers) if args.pin else get_pool(workers)
+        with pool as executor:
+            for repeat in range(args.repeat):
+                elapsed_ns = run(executor, MAPS[map_name], fn, tasks)
+                writer.writerow(
+                    {
+                        "python": platform.python_version(),
+                        "kernel": args.kernel,
+                        "map": map_name,
+                        "workers": workers,
+                        "pinned": args.pin,
+                        "tasks": num_tasks,
+                        "duration": duration,
+                        "repeat": repeat,
+                        "elapsed_ns": elapsed_ns,
+                    }
+                )
+
+    if output is not sys.stdout:
+        output.close()
+
+
+if __name__ == "__main__":
+    main()
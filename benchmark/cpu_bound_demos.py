@@ -0,0 +1,108 @@
+import itertools
+import os
+import sys
+import threading
+import time
+from concurrent.futures import wait
+from contextlib import closing
+
+from cpu_work import pinned_pool, simulated_work
+
+# futuretools.py and pool.py live in the repo root, one level up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from futuretools import bounded_map, unordered_map
+from pool import available_cpus, get_pool
+
+
+def cpu_blocking_behavior():
+    """map.py with real work: ordered vs completion-order results"""
+
+    def variable_work(units_and_value):
+        units, value = units_and_value
+        simulated_work(units)
+        return value * 10
+
+    # Same shape as map.py - first task is the slowest
+    tasks = [(3, 1), (1, 2), (1, 3), (1, 4)]  # (work units, value) pairs
+
+    for name, map_fn in [("ordered", bounded_map), ("unordered", unordered_map)]:
+        with get_pool(min(len(tasks), available_cpus())) as executor:
+            start = time.perf_counter()
+            with closing(map_fn(executor, variable_work, tasks)) as results:
+                first = next(results)
+                first_at = time.perf_counter() - start
+                rest = list(results)
+            total = time.perf_counter() - start
+
+        print(
+            f"{name:>9}: first result {first} after {first_at:.2f}s, "
+            f"all {[first] + rest} after {total:.2f}s"
+        )
+
+
+def cpu_list_blocking():
+    """map2.py with real work: list() waits for the slowest task"""
+    data = [5, 2, 3]
+
+    with get_pool(min(len(data), available_cpus())) as executor:
+        start = time.perf_counter()
+        with closing(bounded_map(executor, simulated_work, data)) as results:
+            digests = list(results)
+        elapsed = time.perf_counter() - start
+
+    print(f"list() returned {len(digests)} digests after {elapsed:.2f}s")
+    print(f"(one core would need {sum(data)} units, the slowest task alone 5)")
+
+
+def cpu_work_scheduling():
+    """map3.py with real work: 6 tasks on 2 workers"""
+    events = []  # (timestamp, task, event, worker) - printed afterwards
+
+    def tracked_work(n):
+        worker_id = threading.get_ident()
+        events.append((time.perf_counter(), n, "🚀 STARTED", worker_id))
+        simulated_work(1)
+        events.append((time.perf_counter(), n, "✅ FINISHED", worker_id))
+        return n * 10
+
+    with get_pool(2) as executor:
+        start = time.perf_counter()
+        with closing(bounded_map(executor, tracked_work, range(1, 7))) as results:
+            list(results)
+
+    for timestamp, n, event, worker_id in sorted(events):
+        print(f"    +{timestamp - start:.3f}s  {event} task {n} (thread {worker_id})")
+
+
+def cpu_worker_scaling():
+    """whyNotMoreThread.py with real work: do more threads help?"""
+    num_tasks = 8
+    baseline = None
+
+    for num_workers, pinned in itertools.product([1, 2, 4, 8], [False, True]):
+        pool = pinned_pool(num_workers) if pinned else get_pool(num_workers)
+        with pool as executor:
+            start = time.perf_counter()
+            futures = [executor.submit(simulated_work, 1) for _ in range(num_tasks)]
+            wait(futures)
+            elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        print(
+            f"{num_workers} workers{' (pinned)' if pinned else ''}: "
+            f"{num_tasks} tasks in {elapsed:.2f}s "
+            f"(speedup {baseline / elapsed:.1f}x)"
+        )
+
+    print(f"This process can use {available_cpus()} CPUs - speedup stops there")
+
+
+if __name__ == "__main__":
+    print("=== map.py, CPU-bound ===")
+    cpu_blocking_behavior()
+    print("\n=== map2.py, CPU-bound ===")
+    cpu_list_blocking()
+    print("\n=== map3.py, CPU-bound ===")
+    cpu_work_scheduling()
+    print("\n=== whyNotMoreThread.py, CPU-bound ===")
+    cpu_worker_scaling()
@@ -0,0 +1,64 @@
+import hashlib
+import itertools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Hashing this many rounds of a 1MB buffer is one "unit" of work -
+# roughly 50ms on a modern core
+ROUNDS_PER_UNIT = 50
+
+_BUFFER = os.urandom(1 << 20)  # 1MB, shared read-only by every worker
+
+
+def simulated_work(n):
+    """CPU-bound stand-in for time.sleep(n): hash 1MB, n * 50 times.
+
+    time.sleep() releases the GIL, so sleep-based demos only ever show
+    I/O-bound behaviour. hashlib also releases the GIL, but only while it is
+    actually crunching a large buffer - so this is real work the threads
+    have to share CPU cores for, not a wait.
+
+    (Each round hashes the same 1MB buffer rather than chaining digests:
+    a 32-byte digest is too small for hashlib to bother releasing the GIL.)
+    """
+    digest = b""
+    for _ in range(n * ROUNDS_PER_UNIT):
+        digest = hashlib.sha256(_BUFFER).digest()
+    return digest
+
+
+def pinned_pool(max_workers):
+    """A ThreadPoolExecutor whose threads are each pinned to their own CPU.
+
+    Left alone, the OS may move a thread to another core between time
+    slices, leaving its warm L1/L2 cache behind. Pinning worker i to the
+    i-th usable CPU (wrapping around if there are more workers than CPUs)
+    keeps each worker's data on one core. Linux only - elsewhere this is
+    an ordinary pool.
+
+    The pool comes back warm: all max_workers threads are already started
+    (and pinned), like get_pool()'s, so thread start-up never lands inside
+    a timed region.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return _warmed(ThreadPoolExecutor(max_workers=max_workers), max_workers)
+
+    cpus = sorted(os.sched_getaffinity(0))
+    next_worker = itertools.count()
+
+    def pin_to_cpu():
+        # Runs once in each new worker thread; pid 0 means "this thread"
+        os.sched_setaffinity(0, {cpus[next(next_worker) % len(cpus)]})
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, initializer=pin_to_cpu)
+    return _warmed(pool, max_workers)
+
+
+def _warmed(pool, max_workers):
+    """Force a ThreadPoolExecutor to start all of its threads now"""
+    # Each no-op blocks until all of them are running, so no thread can pick
+    # up a second one - the pool has to start max_workers threads
+    everyone_started = threading.Barrier(max_workers)
+    wait([pool.submit(everyone_started.wait) for _ in range(max_workers)])
+    return pool
@@ -0,0 +1,228 @@
+import collections
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _MapIterator:
+    """Iterator over a map's results that cancels leftover work on close().
+
+    The maps below submit their first futures before anyone calls next().
+    A generator's finally block only runs once the generator has started,
+    so closing a plain generator before its first next() would leave all
+    of that work queued. close() here cancels it either way.
+    """
+
+    def __init__(self, results, cancel_pending):
+        self._results = results  # generator doing the actual iteration
+        self._cancel_pending = cancel_pending
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._results)
+
+    def close(self):
+        self._results.close()
+        self._cancel_pending()
+
+
+def bounded_map(
+    executor, fn, *iterables, prefetch=1, on_done=None, max_workers=None
+):
+    """Like executor.map(), but only keeps a sliding window of futures alive.
+
+    executor.map() submits EVERY task up front, so finished-but-not-yet-consumed
+    results pile up in memory. Here at most max_workers + prefetch futures are
+    outstanding; a new task is only submitted when the consumer takes a result.
+    With prefetch=0, at most max_workers results can sit in memory at once.
+
+    If given, on_done(future, *args) is called the moment each task
+    finishes (via add_done_callback()), with the same args the task was
+    submitted with - so callers know WHICH task finished without having to
+    decode it from the result.
+
+    max_workers defaults to the executor's own worker count. The stdlib
+    pools (and get_pool()'s) only keep it in a private attribute, so pass it
+    explicitly for any other Executor.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be >= 0")
+
+    if max_workers is None:
+        max_workers = getattr(executor, "_max_workers", None)
+        if max_workers is None:
+            raise TypeError(
+                f"can't tell how many workers {type(executor).__name__} has - "
+                f"pass max_workers= to bounded_map()"
+            )
+    window = max_workers + prefetch
+    args_iter = zip(*iterables)
+    futures = collections.deque()
+
+    def submit(args):
+        future = executor.submit(fn, *args)
+        if on_done is not None:
+            future.add_done_callback(lambda done: on_done(done, *args))
+        futures.append(future)
+
+    # Like executor.map(), the first window of work starts immediately -
+    # not on the first next() call
+    for args in args_iter:
+        submit(args)
+        if len(futures) >= window:
+            break
+
+    def result_iterator():
+        try:
+            while futures:
+                # Keep the future in the deque while we wait on it, so it is
+                # still cancelled if the consumer closes us mid-wait
+                result = futures[0].result()
+                futures.popleft()
+
+                for args in args_iter:
+                    submit(args)
+                    break
+
+                yield result
+        finally:
+            # Consumer stopped early (close(), break, exception) -
+            # don't leave queued work behind
+            cancel_pending()
+
+    def cancel_pending():
+        for future in futures:
+            future.cancel()
+
+    return _MapIterator(result_iterator(), cancel_pending)
+
+
+def _run_chunk(fn, chunk):
+    return [fn(*args) for args in chunk]
+
+
+def chunked_map(executor, fn, *iterables, chunksize=1):
+    """Like executor.map(), but sends tasks to the workers in batches.
+
+    For tiny tasks (like pow()), submitting one future per call costs more
+    than the work itself. Grouping calls into chunks of chunksize means one
+    submit / queue round-trip per chunk instead of per call - the same idea
+    as ProcessPoolExecutor.map(chunksize=...), which ThreadPoolExecutor
+    ignores.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+
+    args_iter = zip(*iterables)
+    futures = []
+    while chunk := list(itertools.islice(args_iter, chunksize)):
+        futures.append(executor.submit(_run_chunk, fn, chunk))
+
+    def result_iterator():
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            cancel_pending()
+
+    def cancel_pending():
+        for future in futures:
+            future.cancel()
+
+    return _MapIterator(result_iterator(), cancel_pending)
+
+
+class FutureResultCollection:
+    """Hands back futures one at a time, in the order they finish.
+
+    as_completed() registers a waiter on every pending future each time it is
+    called and removes them again afterwards, so calling it over and over in
+    a loop is O(N^2) callback churn. This collection instead attaches ONE
+    done-callback per future for its whole lifetime and wakes the consumer
+    through a single Event.
+    """
+
+    def __init__(self):
+        self._pending = set()  # futures not yet handed out
+        self._completed = collections.deque()  # finished, waiting for next_done()
+        self._lock = threading.Lock()
+        self._done_event = threading.Event()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, future):
+        """Start tracking a future (its callback is registered exactly once)"""
+        self._pending.add(future)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        """Runs in the worker thread (or right away if already done)"""
+        with self._lock:
+            self._completed.append(future)
+            self._done_event.set()
+
+    def next_done(self):
+        """Block until some tracked future finishes, then return it"""
+        if not self._pending:
+            raise IndexError("next_done() on an empty FutureResultCollection")
+
+        self._done_event.wait()
+        with self._lock:
+            future = self._completed.popleft()
+            if not self._completed:
+                self._done_event.clear()
+
+        self._pending.discard(future)
+        return future
+
+    def cancel_pending(self):
+        """Cancel everything that has not been handed out yet"""
+        for future in self._pending:
+            future.cancel()
+
+
+def unordered_map(executor, fn, *iterables):
+    """Like executor.map(), but yields results in COMPLETION order.
+
+    executor.map() yields in submission order, so one slow early task blocks
+    every result behind it. Here the first result arrives as soon as the
+    fastest task is done.
+    """
+    collection = FutureResultCollection()
+    for args in zip(*iterables):
+        collection.add(executor.submit(fn, *args))
+
+    def result_iterator():
+        try:
+            while collection:
+                yield collection.next_done().result()
+        finally:
+            collection.cancel_pending()
+
+    return _MapIterator(result_iterator(), collection.cancel_pending)
+
+
+def _check_close_cancels(map_fn):
+    """Closing a map before its first next() must cancel the queued tasks"""
+    ran = []
+
+    def task(n):
+        time.sleep(0.1)
+        ran.append(n)
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    map_fn(executor, task, range(10)).close()
+    executor.shutdown(wait=True)
+    # Only the tasks already running when close() was called can finish
+    assert len(ran) <= 2, f"{map_fn.__name__}: {len(ran)} tasks ran after close()"
+    print(f"{map_fn.__name__}: close() before next() cancelled the queued tasks")
+
+
+if __name__ == "__main__":
+    _check_close_cancels(bounded_map)
+    _check_close_cancels(unordered_map)
+    _check_close_cancels(chunked_map)
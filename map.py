@@ -1,5 +1,13 @@
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+from futuretools import unordered_map
+from pool import get_pool
+
+# Multiplies every delay below. The default 0.1 keeps a run to ~0.3s;
+# DEMO_SCALE=1 gives the original 3s / 1s timings.
+SCALE = float(os.environ.get("DEMO_SCALE", 0.1))
 
 
 def understand_blocking_behavior():
@@ -7,28 +15,35 @@ def understand_blocking_behavior():
 
     def variable_work(delay_and_value):
         delay, value = delay_and_value
-        print(f"    Starting {value} (will take {delay}s)")
+        print(f"    Starting {value} (will take {delay:g}s)")
         time.sleep(delay)
         print(f"    Finished {value}")
         return value * 10
 
     # Tasks with different delays - first task is slowest
-    tasks = [(3, 1), (1, 2), (1, 3), (1, 4)]  # (delay, value) pairs
+    # (delay, value) pairs
+    tasks = [(3 * SCALE, 1), (1 * SCALE, 2), (1 * SCALE, 3), (1 * SCALE, 4)]
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    # Sleeping tasks don't need a CPU each - one worker per task
+    with get_pool(len(tasks)) as executor:
         print("Creating iterator (instant)...")
-        result_iterator = executor.map(variable_work, tasks)
+        # Results come back in COMPLETION order, so the slow first task
+        # no longer holds up the fast ones behind it
+        result_iterator = unordered_map(executor, variable_work, tasks)
 
         print("Starting to consume results...")
         start_time = time.time()
 
-        for i, result in enumerate(result_iterator):
-            elapsed = time.time() - start_time
-            print(f"Iteration {i}: got {result} after {elapsed:.2f}s total")
+        arrival_order = []
+        with closing(result_iterator):
+            for i, result in enumerate(result_iterator):
+                elapsed = time.time() - start_time
+                print(f"Iteration {i}: got {result} after {elapsed:.2f}s total")
+                arrival_order.append(result)
 
-            # The iterator gives results in submission order,
-            # so we wait for the slow first task even though
-            # the other tasks finish much faster
+    submission_order = [value * 10 for _, value in tasks]
+    print(f"Submission order: {submission_order}")
+    print(f"Arrival order:    {arrival_order}")
 
 
 understand_blocking_behavior()
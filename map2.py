@@ -1,5 +1,8 @@
 import time
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+from futuretools import bounded_map, unordered_map
 
 
 # Let's make the processing time variable
@@ -17,9 +20,10 @@ if __name__ == "__main__":
     # The first task (5s) will take the longest.
     data = [5, 2, 3]
 
-    with ThreadPoolExecutor(max_workers=3) as executor:
+    # Sleeping tasks don't need a CPU each - one worker per task
+    with ThreadPoolExecutor(max_workers=len(data)) as executor:
         print(f"[{time.strftime('%H:%M:%S')}] Submitting tasks for {data}...")
-        results_iterator = executor.map(process_data, data)
+        results_iterator = bounded_map(executor, process_data, data)
 
         print(
             f"[{time.strftime('%H:%M:%S')}] Calling list(). The main thread will now block until ALL tasks are complete..."
@@ -27,10 +31,20 @@ if __name__ == "__main__":
 
         # This line will block for approximately 5 seconds, because it must wait for
         # the first and longest task to finish before it can get all the results.
-        all_results = list(results_iterator)
+        with closing(results_iterator):
+            all_results = list(results_iterator)
 
         # This line will only execute after about 5 seconds.
         print(
             f"[{time.strftime('%H:%M:%S')}] list() has returned. All processing is complete."
         )
         print("\nFinal results (in original order):", all_results)
+
+        # Same tasks again, but consumed in COMPLETION order. The first
+        # result now shows up after ~2 seconds instead of ~5.
+        print(
+            f"\n[{time.strftime('%H:%M:%S')}] Resubmitting, consuming results as they complete..."
+        )
+        with closing(unordered_map(executor, process_data, data)) as results_iterator:
+            for result in results_iterator:
+                print(f"[{time.strftime('%H:%M:%S')}] Got: {result}")
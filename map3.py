@@ -1,146 +1,254 @@
+import queue
+import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+from futuretools import bounded_map
+from pool import get_pool
+
+# Inputs for demonstrate_actual_map_behavior(), built once up front rather
+# than on every call, so input construction never lands in a timed region
+_TASKS_2W = (1, 2, 3, 4, 5)
+_TASKS_1W = (1, 2, 3)
+
+# Workers don't print() directly - every print takes the stdout lock, which
+# lines the workers up behind each other. They drop messages on this queue
+# instead, and a single logger thread does all the writing. The logger only
+# runs while compare_builtin_vs_executor_map() does.
+LOG_Q = queue.SimpleQueue()
+
+
+def _logger():
+    while True:
+        message = LOG_Q.get()
+        if message is None:
+            break
+        sys.stdout.write(message)
+        sys.stdout.flush()
+
+
+def log(message):
+    """print() replacement that goes through the logger thread"""
+    LOG_Q.put(f"{message}\n")
+
+
+def print_timeline(events, start):
+    """Print (timestamp, task, event, worker) records, oldest first.
+
+    Workers only append to `events` while the demo runs - printing from
+    inside the timed region would take the stdout lock on every line and
+    add its own delay to the timings we are trying to show.
+    """
+    print("\n🕒 Timeline:")
+    for timestamp, n, event, worker_id in sorted(events):
+        print(f"    +{timestamp - start:.3f}s  {event} task {n} (thread {worker_id})")
 
 
 def demonstrate_actual_map_behavior():
-    """Shows the real behavior of ThreadPoolExecutor.map()"""
+    """Shows how bounded_map() only keeps workers + prefetch tasks in flight"""
+
+    events = []
 
     def tracked_work_with_timing(n):
-        start_time = time.time()
-        print(f"    🚀 STARTED work on {n} at {start_time:.2f}")
+        # One C call - current_thread().name would look us up under a lock
+        worker_id = threading.get_ident()
+        events.append((time.perf_counter(), n, "🚀 STARTED", worker_id))
         time.sleep(1)  # Simulate work
-        end_time = time.time()
-        print(f"    ✅ FINISHED work on {n} at {end_time:.2f}")
         return n * 10
 
+    def announce_finished(future, n):
+        """Done-callback: fires the moment task n finishes"""
+        if future.cancelled():
+            return
+        worker_id = threading.get_ident()
+        event = "✅ FINISHED" if future.exception() is None else "💥 FAILED"
+        events.append((time.perf_counter(), n, event, worker_id))
+
     print("🧪 TESTING WITH DIFFERENT WORKER COUNTS")
 
     # Test with 2 workers
     print("\n=== With 2 workers ===")
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        print(f"Creating iterator at {time.time():.2f}")
+    with get_pool(2) as executor:
+        start = time.perf_counter()
+        print("Creating iterator at +0.00s")
+
+        result_iterator = bounded_map(
+            executor,
+            tracked_work_with_timing,
+            _TASKS_2W,
+            on_done=announce_finished,
+        )
 
-        result_iterator = executor.map(tracked_work_with_timing, [1, 2, 3, 4, 5])
+        with closing(result_iterator):
+            print(f"Iterator created at +{time.perf_counter() - start:.2f}s")
+            print("Notice: work started on first 2 items immediately!")
+            print("(only items 1-3 are submitted - 2 workers + 1 prefetch)")
 
-        print(f"Iterator created at {time.time():.2f}")
-        print("Notice: work started on first 2 items immediately!")
+            print(f"\nConsuming first result at +{time.perf_counter() - start:.2f}s")
+            first_result = next(result_iterator)
+            print(f"Got: {first_result}")
 
-        time.sleep(0.5)  # Let some work progress
-        print(f"\nConsuming first result at {time.time():.2f}")
-        first_result = next(result_iterator)
-        print(f"Got: {first_result}")
+            print(
+                f"\nConsuming remaining results at +{time.perf_counter() - start:.2f}s"
+            )
+            remaining = list(result_iterator)
+            print(f"Got: {remaining}")
 
-        time.sleep(2)  # Let more work happen
-        print(f"\nConsuming remaining results at {time.time():.2f}")
-        remaining = list(result_iterator)
-        print(f"Got: {remaining}")
+    print_timeline(events, start)
+    events.clear()
 
     # Test with 1 worker to see the difference
     print("\n" + "=" * 50)
     print("\n=== With 1 worker ===")
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        print(f"Creating iterator at {time.time():.2f}")
+    with get_pool(1) as executor:
+        start = time.perf_counter()
+        print("Creating iterator at +0.00s")
+
+        result_iterator = bounded_map(
+            executor,
+            tracked_work_with_timing,
+            _TASKS_1W,
+            on_done=announce_finished,
+        )
 
-        result_iterator = executor.map(tracked_work_with_timing, [1, 2, 3])
+        with closing(result_iterator):
+            print(f"Iterator created at +{time.perf_counter() - start:.2f}s")
+            print("Notice: only 1 worker, so only work on item 1 starts!")
 
-        print(f"Iterator created at {time.time():.2f}")
-        print("Notice: only 1 worker, so only work on item 1 starts!")
+            print(f"\nConsuming first result at +{time.perf_counter() - start:.2f}s")
+            first_result = next(result_iterator)
+            print(f"Got: {first_result}")
 
-        time.sleep(0.5)
-        print(f"\nConsuming first result at {time.time():.2f}")
-        first_result = next(result_iterator)
-        print(f"Got: {first_result}")
+            print(f"\nConsuming second result at +{time.perf_counter() - start:.2f}s")
+            second_result = next(result_iterator)
+            print(f"Got: {second_result}")
 
-        print(f"\nConsuming second result at {time.time():.2f}")
-        second_result = next(result_iterator)
-        print(f"Got: {second_result}")
+    print_timeline(events, start)
 
 
 def compare_builtin_vs_executor_map():
-    """Shows the difference between built-in map() and ThreadPoolExecutor.map()"""
+    """Shows the difference between built-in map() and bounded_map() on a pool"""
 
+    # Everything here goes through log(), so worker and main-thread
+    # messages come out of the one queue in the order they happened
     def side_effect_work(n):
-        print(f"    Working on {n}")
+        log(f"    Working on {n}")
         return n * 2
 
-    print("🐍 BUILT-IN map() - Truly lazy")
-    print("Creating built-in map object...")
-    builtin_map = map(side_effect_work, [1, 2, 3])
-    print("Map object created - notice no work happened yet!")
-
-    time.sleep(1)
-    print("Still no work...")
-
-    print("Now consuming first result:")
-    first = next(builtin_map)
-    print(f"Got: {first}")
-
-    print("\n⚡ ThreadPoolExecutor.map() - Eager worker utilization")
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        print("Creating executor map object...")
-        executor_map = executor.map(side_effect_work, [4, 5, 6])
-        print("Map object created - work started immediately!")
-
-
-import threading
-import time
-from concurrent.futures import ThreadPoolExecutor
+    logger = threading.Thread(target=_logger, name="logger")
+    logger.start()
+    try:
+        log("🐍 BUILT-IN map() - Truly lazy")
+        log("Creating built-in map object...")
+        builtin_map = map(side_effect_work, [1, 2, 3])
+        log("Map object created - notice no work happened yet!")
+
+        time.sleep(1)
+        log("Still no work...")
+
+        log("Now consuming first result:")
+        first = next(builtin_map)
+        log(f"Got: {first}")
+
+        log("\n⚡ bounded_map() - Eager, but only for a window of tasks")
+        with get_pool(2) as executor:
+            log("Creating executor map object...")
+            executor_map = bounded_map(executor, side_effect_work, [4, 5, 6])
+            log("Map object created - the first window (2 workers + 1) started!")
+    finally:
+        # Drain everything still queued before returning, so later print()s
+        # can't overtake it
+        LOG_Q.put(None)
+        logger.join()
 
 
 def demonstrate_work_scheduling_independence():
-    """Shows that workers pick up new tasks immediately, regardless of result consumption"""
+    """Shows that workers run ahead of result consumption, up to the window"""
+
+    events = []
 
     def tracked_work(n):
-        """Work that announces its lifecycle clearly"""
-        worker_id = threading.current_thread().name
-        print(f"    🚀 Worker {worker_id} STARTED task {n} at {time.time():.2f}")
+        """Work that records its lifecycle clearly"""
+        # One C call - current_thread().name would look us up under a lock
+        worker_id = threading.get_ident()
+        events.append((time.perf_counter(), n, "🚀 STARTED", worker_id))
         time.sleep(1)  # Simulate work taking 1 second
-        print(f"    ✅ Worker {worker_id} FINISHED task {n} at {time.time():.2f}")
         return n * 10
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
+    # Instead of sleeping in the main thread and hoping work has progressed,
+    # every future reports its own completion as it happens
+    finished = queue.SimpleQueue()
+
+    def announce_finished(future, n):
+        """Done-callback: fires the moment task n finishes"""
+        if future.cancelled():
+            return
+        worker_id = threading.get_ident()
+        event = "✅ FINISHED" if future.exception() is None else "💥 FAILED"
+        events.append((time.perf_counter(), n, event, worker_id))
+        finished.put(future)
+
+    with get_pool(2) as executor:
         print("🧪 TESTING WORK SCHEDULING vs RESULT CONSUMPTION")
         print("=" * 60)
 
-        start_time = time.time()
-        print(f"Creating iterator with 6 tasks at {start_time:.2f}")
-
-        # Create iterator with more tasks than workers
-        result_iterator = executor.map(tracked_work, [1, 2, 3, 4, 5, 6])
-
-        print(f"Iterator created at {time.time():.2f}")
-        print("Notice: Tasks 1 and 2 started immediately (filling 2 workers)")
-
-        # Wait and watch what happens - workers should pick up new tasks
-        # even though we haven't consumed any results yet
-        print(f"\n⏰ Waiting 1.5 seconds without consuming results...")
-        time.sleep(1.5)
-        print(f"Current time: {time.time():.2f}")
-        print("Notice: Workers already picked up tasks 3 and 4!")
-
-        # Now consume first result - this shouldn't affect work scheduling
-        print(f"\n📥 Consuming first result at {time.time():.2f}")
-        first_result = next(result_iterator)
-        print(f"Got result: {first_result}")
-        print("Notice: No new work started just because we consumed a result")
-
-        # Wait more to see continued work scheduling
-        print(f"\n⏰ Waiting another 1.5 seconds...")
-        time.sleep(1.5)
-        print(f"Current time: {time.time():.2f}")
-        print("Notice: Workers continued to tasks 5 and 6 automatically!")
-
-        # Consume remaining results quickly
-        print(f"\n📥 Consuming remaining results at {time.time():.2f}")
-        remaining_results = list(result_iterator)
-        print(f"Got remaining results: {remaining_results}")
-
-        total_time = time.time() - start_time
-        print(f"\nTotal time: {total_time:.2f} seconds")
-        print(
-            "Key insight: Work scheduling happened independently of result consumption!"
+        start_time = time.perf_counter()
+        print("Creating iterator with 6 tasks at +0.00s")
+
+        # Create iterator with more tasks than workers.
+        # Window = 2 workers + 2 prefetch = 4 tasks submitted up front
+        result_iterator = bounded_map(
+            executor,
+            tracked_work,
+            [1, 2, 3, 4, 5, 6],
+            prefetch=2,
+            on_done=announce_finished,
         )
 
+        with closing(result_iterator):
+            print(f"Iterator created at +{time.perf_counter() - start_time:.2f}s")
+            print("Notice: Tasks 1 and 2 started immediately (filling 2 workers)")
+
+            # Wait and watch what happens - workers should pick up new tasks
+            # even though we haven't consumed any results yet
+            print(f"\n⏰ Waiting for 2 tasks to finish without consuming results...")
+            finished.get()
+            finished.get()
+            print(f"Current time: +{time.perf_counter() - start_time:.2f}s")
+            print("Notice: Workers move straight on to tasks 3 and 4!")
+
+            # Now consume first result - this frees a slot in the window
+            print(
+                f"\n📥 Consuming first result at +{time.perf_counter() - start_time:.2f}s"
+            )
+            first_result = next(result_iterator)
+            print(f"Got result: {first_result}")
+            print("Notice: Consuming a result let task 5 into the window")
+
+            # Wait more to see continued work scheduling
+            print(f"\n⏰ Waiting for tasks 3 and 4 to finish...")
+            finished.get()
+            finished.get()
+            print(f"Current time: +{time.perf_counter() - start_time:.2f}s")
+            print("Notice: Task 6 is still waiting for a free slot in the window!")
+
+            # Consume remaining results quickly
+            print(
+                f"\n📥 Consuming remaining results at +{time.perf_counter() - start_time:.2f}s"
+            )
+            remaining_results = list(result_iterator)
+            print(f"Got remaining results: {remaining_results}")
+
+        total_time = time.perf_counter() - start_time
+
+    print_timeline(events, start_time)
+    print(f"\nTotal time: {total_time:.2f} seconds")
+    print(
+        "Key insight: Workers run ahead of result consumption, "
+        "but only as far as the window allows!"
+    )
+
 
 demonstrate_work_scheduling_independence()
 # compare_builtin_vs_executor_map()
@@ -0,0 +1,109 @@
+import collections
+import os
+import queue
+import threading
+from concurrent.futures import Executor, Future
+
+# Worker threads shared by the whole process, started on first use
+_WORK_QUEUE = queue.SimpleQueue()
+_THREADS = []
+_THREADS_LOCK = threading.Lock()
+
+
+def available_cpus():
+    """How many CPUs this process may actually run on.
+
+    os.cpu_count() counts every CPU in the machine, even ones we are not
+    allowed to use (containers, taskset, CI runners). sched_getaffinity()
+    only exists on Linux, so fall back to cpu_count() elsewhere.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_pool(max_workers):
+    """Return an executor backed by the shared, reusable worker threads.
+
+    Creating a fresh ThreadPoolExecutor per demo means creating (and tearing
+    down) fresh threads every time. Instead every caller shares one set of
+    threads, which only ever grows to the LARGEST max_workers anyone asked
+    for.
+
+    The returned executor still runs at most max_workers tasks at once, so a
+    demo that asks for 1 worker behaves like it has 1 worker. Using it in a
+    `with` block waits for its own tasks but leaves the shared threads alive.
+    """
+    if max_workers <= 0:
+        raise ValueError("max_workers must be greater than 0")
+
+    with _THREADS_LOCK:
+        while len(_THREADS) < max_workers:
+            thread = threading.Thread(
+                target=_worker, name=f"SharedPool_{len(_THREADS)}", daemon=True
+            )
+            thread.start()
+            _THREADS.append(thread)
+    return _PoolView(max_workers)
+
+
+def _worker():
+    while True:
+        fn, args = _WORK_QUEUE.get()
+        fn(*args)
+
+
+class _PoolView(Executor):
+    """Limits how many tasks one caller runs at once on the shared threads"""
+
+    def __init__(self, max_workers):
+        self._max_workers = max_workers
+        self._backlog = collections.deque()  # (future, fn, args, kwargs)
+        self._running = 0
+        self._shutdown = False
+        self._state_changed = threading.Condition()
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._state_changed:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+
+            future = Future()
+            self._backlog.append((future, fn, args, kwargs))
+            self._start_ready()
+        return future
+
+    def _start_ready(self):
+        """Hand backlog items to the shared threads while under the limit"""
+        while self._backlog and self._running < self._max_workers:
+            self._running += 1
+            _WORK_QUEUE.put((self._run, self._backlog.popleft()))
+
+    def _run(self, future, fn, args, kwargs):
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+        finally:
+            with self._state_changed:
+                self._running -= 1
+                self._start_ready()
+                self._state_changed.notify_all()
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        """Stop accepting work - the shared threads stay alive for reuse"""
+        with self._state_changed:
+            self._shutdown = True
+            if cancel_futures:
+                for future, *_ in self._backlog:
+                    future.cancel()
+                self._backlog.clear()
+            if wait:
+                self._state_changed.wait_for(
+                    lambda: not self._running and not self._backlog
+                )
@@ -1,35 +1,77 @@
+import argparse
+import importlib.util
+import itertools
 import os
+import sys
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 
 import psutil
 
+# futuretools.py lives in the repo root, one level up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from futuretools import bounded_map
 
-def demonstrate_actual_memory_usage():
+# Created once - building a Process object re-reads /proc every time
+_PROC = psutil.Process()
+
+
+def _numpy_arange():
+    # numpy is only needed for this mode - list and range work without it
+    import numpy as np
+
+    return np.arange(500000, dtype=np.int32)
+
+
+# Three ways to hand back the same 500k numbers, very different memory costs
+LARGE_DATA_BUILDERS = {
+    # 500k boxed ints + the list's pointer array: ~18MB
+    "list": lambda: list(range(500000)),
+    # Lazy - just start/stop/step, ~48 bytes. Enough if callers only iterate
+    "range": lambda: range(500000),
+    # One dense int32 buffer: 500k * 4 bytes = ~2MB
+    "numpy": _numpy_arange,
+}
+
+
+def memory_intensive_work(n, mode):
+    """Work that creates large results.
+
+    Lives at module level (not inside the demo) because it runs in worker
+    PROCESSES, and those can only be handed functions they can import.
+    """
+    print(f"    Creating large result for task {n}")
+    # Simulate a large result (like processed image data, parsed documents, etc.)
+    large_data = LARGE_DATA_BUILDERS[mode]()
+    return {"task_id": n, "large_data": large_data}
+
+
+def demonstrate_actual_memory_usage(mode="list"):
     """Shows the real memory accumulation pattern"""
 
     def get_memory_usage():
         """Get current memory usage in MB"""
-        process = psutil.Process(os.getpid())
-        return process.memory_info().rss / 1024 / 1024
-
-    def memory_intensive_work(n):
-        """Work that creates large results"""
-        print(f"    Creating large result for task {n}")
-        # Simulate a large result (like processed image data, parsed documents, etc.)
-        large_data = list(range(500000))  # ~4MB per result
-        return {"task_id": n, "large_data": large_data}
+        return _PROC.memory_info().rss / 1024 / 1024
 
-    print("📊 MEMORY USAGE ANALYSIS")
+    print(f"📊 MEMORY USAGE ANALYSIS (mode: {mode})")
     print("=" * 40)
 
     baseline_memory = get_memory_usage()
     print(f"Baseline memory: {baseline_memory:.1f} MB")
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        # Create iterator with many tasks
+    # Worker processes build their results in parallel, each with its own
+    # GIL - threads would take turns allocating all those objects. Finished
+    # results are pickled back here, so the buffer still lives in THIS
+    # process and shows up in the numbers below.
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        # Create iterator with many tasks.
+        # prefetch=0: never more than max_workers (4) results alive at once,
+        # instead of executor.map() submitting all 10 up front
         tasks = list(range(1, 11))  # 10 tasks
-        result_iterator = executor.map(memory_intensive_work, tasks)
+        result_iterator = bounded_map(
+            executor, memory_intensive_work, tasks, itertools.repeat(mode), prefetch=0
+        )
 
         print(f"Iterator created - memory: {get_memory_usage():.1f} MB")
 
@@ -40,24 +82,58 @@ def demonstrate_actual_memory_usage():
         buffer_memory = get_memory_usage()
         print(f"After buffer accumulation - memory: {buffer_memory:.1f} MB")
         print(f"Memory increase: {buffer_memory - baseline_memory:.1f} MB")
-        print("Notice: Multiple results are stored in memory simultaneously!")
+        print("Notice: Only the first 4 results are in memory - the rest")
+        print("        are not submitted until we start consuming!")
 
-        # Now consume results and watch memory usage
+        # Now consume results and watch memory usage. Samples are only
+        # recorded here and printed afterwards, so stdout writes don't slow
+        # down the loop we are measuring.
         print(f"\n📥 Consuming results one by one...")
-        for i, result in enumerate(result_iterator):
-            current_memory = get_memory_usage()
-            print(f"After consuming result {i+1}: {current_memory:.1f} MB")
-
-            # Show that memory can decrease as results are consumed
-            if i == 3:  # After consuming several results
-                print(
-                    f"   Memory freed as results consumed: {buffer_memory - current_memory:.1f} MB"
+        samples = []  # (seconds since start, results consumed, memory MB)
+        consume_start = time.perf_counter()
+        with closing(result_iterator):
+            for i, result in enumerate(result_iterator):
+                samples.append(
+                    (time.perf_counter() - consume_start, i + 1, get_memory_usage())
                 )
 
+        for elapsed, consumed, current_memory in samples:
+            print(
+                f"After consuming result {consumed}: {current_memory:.1f} MB"
+                f" (+{elapsed:.3f}s)"
+            )
+
+        # This process holds at most ~4 results at a time: they drain as we
+        # consume them and refill as new ones are pickled back from the
+        # workers. So memory goes up and down within a bounded range instead
+        # of growing with all 10 results.
+        memory_values = [current_memory for _, _, current_memory in samples]
+        print(
+            f"   Range while consuming: {min(memory_values):.1f} - "
+            f"{max(memory_values):.1f} MB "
+            f"(peak {max(memory_values) - buffer_memory:+.1f} MB vs after accumulation)"
+        )
+
         final_memory = get_memory_usage()
         print(f"\nFinal memory: {final_memory:.1f} MB")
         print(f"Net memory change: {final_memory - baseline_memory:.1f} MB")
 
 
-# Be careful running this - it uses significant memory!
-demonstrate_actual_memory_usage()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Watch how much memory buffered results take up"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=sorted(LARGE_DATA_BUILDERS),
+        default="list",
+        help="how each task builds its large result (default: list)",
+    )
+    args = parser.parse_args()
+    # Checked here, not left to the workers - otherwise the missing import
+    # only surfaces as a traceback out of the first result
+    if args.mode == "numpy" and importlib.util.find_spec("numpy") is None:
+        parser.error("--mode numpy needs numpy installed (pip install numpy)")
+
+    # Be careful running this - "list" mode uses significant memory!
+    demonstrate_actual_memory_usage(args.mode)
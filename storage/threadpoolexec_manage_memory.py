@@ -1,32 +1,55 @@
+import collections
+
+
 def conceptual_result_buffer():
     """Shows how ThreadPoolExecutor conceptually manages result ordering"""
 
+    _EMPTY = object()  # Marks a slot whose task hasn't finished yet
+
     class ResultBuffer:
         """Conceptual model of how results are buffered internally"""
 
         def __init__(self):
-            self.completed_results = {}  # {task_index: result}
+            # Task indices only ever count up, so a dict keyed by index isn't
+            # needed: slots[0] is task next_to_deliver, slots[1] the one after...
+            self.slots = collections.deque()
             self.next_to_deliver = 0  # Next result index to deliver
 
+        def buffered_indices(self):
+            """Indices of the tasks whose results are waiting in the buffer"""
+            return [
+                self.next_to_deliver + offset
+                for offset, result in enumerate(self.slots)
+                if result is not _EMPTY
+            ]
+
         def store_result(self, task_index, result):
             """Called when a worker completes a task"""
             print(f"📦 Storing result for task {task_index} in buffer")
-            self.completed_results[task_index] = result
-            print(f"   Buffer now contains: {list(self.completed_results.keys())}")
+            offset = task_index - self.next_to_deliver
+            if offset < 0:
+                # Its slot was already popped - a negative index would
+                # overwrite a slot counted from the other end of the deque
+                raise ValueError(
+                    f"task {task_index} was already delivered "
+                    f"(next to deliver: {self.next_to_deliver})"
+                )
+            while len(self.slots) <= offset:
+                self.slots.append(_EMPTY)
+            self.slots[offset] = result
+            print(f"   Buffer now contains: {self.buffered_indices()}")
 
         def try_deliver_next(self):
             """Try to deliver the next result in order"""
-            if self.next_to_deliver in self.completed_results:
-                result = self.completed_results.pop(self.next_to_deliver)
+            if self.slots and self.slots[0] is not _EMPTY:
+                result = self.slots.popleft()
                 print(f"📤 Delivering result for task {self.next_to_deliver}")
-                print(
-                    f"   Buffer after delivery: {list(self.completed_results.keys())}"
-                )
                 self.next_to_deliver += 1
+                print(f"   Buffer after delivery: {self.buffered_indices()}")
                 return result
             else:
                 print(
-                    f"❌ Task {self.next_to_deliver} not ready yet, buffer: {list(self.completed_results.keys())}"
+                    f"❌ Task {self.next_to_deliver} not ready yet, buffer: {self.buffered_indices()}"
                 )
                 return None
 
@@ -50,7 +73,7 @@ def conceptual_result_buffer():
             if delivered is None:
                 break
 
-    print(f"\nFinal buffer state: {buffer.completed_results}")
+    print(f"\nFinal buffer state: {buffer.buffered_indices()}")
 
 
 conceptual_result_buffer()
@@ -1,10 +1,12 @@
-from concurrent.futures import ThreadPoolExecutor
+from futuretools import chunked_map
+from pool import available_cpus, get_pool
 
 # with ThreadPoolExecutor(max_workers=1) as executor:
 #     future = executor.submit(pow, 2, 3)
 #     print(future.result())
 
-with ThreadPoolExecutor(max_workers=2) as executor:
+# pow() is pure CPU work, so more workers than CPUs would just take turns
+with get_pool(min(3, available_cpus())) as executor:
     # Submit individual tasks - like giving separate orders to workers
     future1 = executor.submit(pow, 2, 10)  # Calculate 2^10
     future2 = executor.submit(pow, 3, 5)  # Calculate 3^5
@@ -20,8 +22,12 @@ with ThreadPoolExecutor(max_workers=2) as executor:
 # The submit() method is like handing out individual task tickets.
 # Each call to submit() gives you back one future object,
 # and you have complete control over when and how you collect the results.
-with ThreadPoolExecutor(max_workers=3) as executor:
-    numbers = [1, 2, 3, 4, 5, 6]
-    results = executor.map(pow, numbers, [2, 2, 2, 2, 2, 2])  # Square each number
+numbers = [1, 2, 3, 4, 5, 6]
+with get_pool(min(len(numbers), available_cpus())) as executor:
+    # pow() is so cheap that handing out one task per number costs more than
+    # the math itself - chunksize=3 sends the 6 calls as 2 batches of 3
+    results = chunked_map(
+        executor, pow, numbers, [2, 2, 2, 2, 2, 2], chunksize=3
+    )  # Square each number
     for result in results:
         print(result)
@@ -1,14 +1,18 @@
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ALL_COMPLETED, wait
 
 import psutil  # For monitoring system resources
 
+from pool import get_pool
+
+# Created once - building a Process object re-reads /proc every time
+_PROC = psutil.Process()
+
 
 def monitor_memory_usage():
     """Helper function to see how much memory threads consume"""
-    process = psutil.Process()
-    return process.memory_info().rss / 1024 / 1024  # Memory in MB
+    return _PROC.memory_info().rss / 1024 / 1024  # Memory in MB
 
 
 def simple_task():
@@ -22,12 +26,23 @@ for num_workers in [1, 10, 50, 100]:
     print(f"\n=== Testing with {num_workers} workers ===")
 
     memory_before = monitor_memory_usage()
-    print(f"Memory before creating threads: {memory_before:.2f} MB")
+    threads_before = threading.active_count()
+    print(f"Memory before growing the shared pool: {memory_before:.2f} MB")
 
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+    # The shared pool keeps its threads between rounds - nothing is torn
+    # down, and each round only starts the threads it is missing
+    with get_pool(num_workers) as executor:
         memory_after = monitor_memory_usage()
-        print(f"Memory after creating {num_workers} threads: {memory_after:.2f} MB")
-        print(f"Memory increase: {memory_after - memory_before:.2f} MB")
+        new_threads = threading.active_count() - threads_before
+        print(
+            f"Memory after growing the shared pool to {num_workers} threads: "
+            f"{memory_after:.2f} MB"
+        )
+        print(f"This round started {new_threads} new threads")
+        print(
+            f"Memory increase for the {new_threads} new threads: "
+            f"{memory_after - memory_before:.2f} MB"
+        )
 
         # Submit just 5 simple tasks
         futures = []
@@ -37,9 +52,11 @@ for num_workers in [1, 10, 50, 100]:
             future = executor.submit(simple_task)
             futures.append(future)
 
-        # Wait for all to complete
-        for future in futures:
-            future.result()
+        # Wait for all to complete - one shared waiter for the whole batch,
+        # rather than blocking on each future's own condition in turn
+        wait(futures, return_when=ALL_COMPLETED)
 
         end_time = time.time()
         print(f"Time to complete 5 tasks: {end_time - start_time:.2f} seconds")
+
+    print(f"Threads alive after this round: {threading.active_count()}")